@@ -3,6 +3,7 @@ import threading
 from datetime import datetime
 import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from mikey.audio_recorder import AudioRecorder
 from mikey.audio_transcriber import AudioTranscriber
@@ -42,41 +43,53 @@ class RecordingSession:
         self.recorder.is_recording = False
 
     def transcribe(self, enable_transcription=True, use_local: bool = False,
-                   model_size: str = None, device: str = None):
+                   model_size: str = None, device: str = None, compute_type: str = None,
+                   on_segments=None, use_cache=True):
         """
         Perform transcription on the recorded files using AudioTranscriber.
-        Processes the transcription of the system (device) audio and mic audio in separate requests.
+        Processes the transcription of the system (device) audio and mic audio in separate requests,
+        concurrently when using Groq.
         Uses merge_device_and_mic_transcripts to merge the two transcripts for a natural conversation flow.
         Returns a dictionary with the merged transcription as well as individual transcriptions.
         
-        Parameters now properly handle None values for cloud-based transcription
+        Parameters now properly handle None values for cloud-based transcription.
+        on_segments, if given, receives batches of segments as they are transcribed,
+        each tagged with its "source" ("device" or "mic").
+        use_cache=False transcribes again even if a merged transcript is cached for these recordings;
+        per-chunk results are still reused.
         """
         if not enable_transcription or not self.files:
             return None
 
         system_file, mic_file = self.files
 
-        print("Transcribing system audio...")
-        system_transcriber = AudioTranscriber(
-            Path(system_file), 
-            session_folder=Path(self.session_folder),
-            use_local=use_local,
-            model_size=model_size or "base",  # Default if not provided
-            device=device or "cpu"  # Default if not provided
-        )
-        system_transcription_result = system_transcriber.transcribe()
-        print("System audio transcription complete.")
+        def tagged(source):
+            if on_segments is None:
+                return None
+            return lambda segments: on_segments([dict(seg, source=source) for seg in segments])
 
-        print("Transcribing mic audio...")
-        mic_transcriber = AudioTranscriber(
-            Path(mic_file), 
-            session_folder=Path(self.session_folder),
-            use_local=use_local,
-            model_size=model_size or "base",  # Default if not provided
-            device=device or "cpu"  # Default if not provided
-        )
-        mic_transcription_result = mic_transcriber.transcribe()
-        print("Mic audio transcription complete.")
+        def transcribe_file(audio_file, source, label):
+            print(f"Transcribing {label} audio...")
+            transcriber = AudioTranscriber(
+                Path(audio_file), 
+                session_folder=Path(self.session_folder),
+                use_local=use_local,
+                model_size=model_size or "base",  # Default if not provided
+                device=device or "cpu",  # Default if not provided
+                compute_type=compute_type,  # None picks the default for the device
+                on_segments=tagged(source),
+                use_cache=use_cache
+            )
+            result = transcriber.transcribe()
+            print(f"{label} audio transcription complete.")
+            return transcriber, result
+
+        # Groq uploads are network-bound, so both files are sent at once; local models run one at a time.
+        sources = [(system_file, "device", "System"), (mic_file, "mic", "Mic")]
+        with ThreadPoolExecutor(max_workers=1 if use_local else len(sources)) as executor:
+            (system_transcriber, system_transcription_result), (_, mic_transcription_result) = executor.map(
+                lambda source: transcribe_file(*source), sources
+            )
 
         # Merge the two transcripts using the new method in AudioTranscriber
         merged_transcript = system_transcriber.merge_device_and_mic_transcripts(
@@ -1,7 +1,20 @@
 import os
 import sys
+import functools
 from pathlib import Path
 
+def _write_atomic(path, data):
+    """
+    Write bytes, or text as UTF-8 with \n line endings on every platform, in one write.
+    The data goes to a .tmp sibling that is renamed into place, so readers never see a partial file.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
 def save_transcripts(session_folder, transcripts):
     """
     Save transcripts to separate markdown files in the given session folder.
@@ -12,26 +25,43 @@ def save_transcripts(session_folder, transcripts):
                             and corresponding transcript text.
 
     Returns:
-        dict: A dictionary mapping transcript types to their saved file paths.
+        dict: A dictionary mapping transcript types to their saved file paths,
+              plus 'merged_text' holding the merged transcript that was written.
     """
     paths = {}
-    
-    merged_path = os.path.join(session_folder, "merged_transcript.md")
-    with open(merged_path, "w", encoding="utf-8") as f:
-        f.write(transcripts["merged"])
-    paths["merged"] = merged_path
+    for kind in ("merged", "system", "mic"):
+        path = os.path.join(session_folder, f"{kind}_transcript.md")
+        _write_atomic(path, transcripts[kind])
+        paths[kind] = path
 
-    system_path = os.path.join(session_folder, "system_transcript.md")
-    with open(system_path, "w", encoding="utf-8") as f:
-        f.write(transcripts["system"])
-    paths["system"] = system_path
+    paths["merged_text"] = transcripts["merged"]
+    return paths
 
-    mic_path = os.path.join(session_folder, "mic_transcript.md")
-    with open(mic_path, "w", encoding="utf-8") as f:
-        f.write(transcripts["mic"])
-    paths["mic"] = mic_path
+@functools.lru_cache(maxsize=8192)
+def _format_whole_seconds(total: int) -> str:
+    h, rem = total // 3600, total % 3600
+    m, s = rem // 60, rem % 60
+    if h:
+        return f"{h:02d}:{m:02d}:{s:02d}"
+    return f"{m:02d}:{s:02d}"
 
-    return paths
+def format_timestamp(seconds):
+    """Format a time offset in seconds as MM:SS, or HH:MM:SS when it exceeds an hour."""
+    # Segment boundaries repeat at whole-second granularity, so the formatted strings are cached.
+    return _format_whole_seconds(int(seconds))
+
+@functools.lru_cache(maxsize=1)
+def cuda_available() -> bool:
+    """Return True when CTranslate2 (the faster-whisper backend) can see a CUDA device."""
+    try:
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+    except Exception:
+        return False
+
+def default_compute_type(device: str) -> str:
+    """Pick the faster-whisper compute type for a device: float16 on CUDA, int8 on CPU."""
+    return "float16" if device == "cuda" else "int8"
 
 def get_base_path():
     """Get base path for resources (app bundle in frozen mode) or the project root in development."""
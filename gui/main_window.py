@@ -4,7 +4,7 @@ import os
 from PyQt5 import QtWidgets, QtCore, QtGui
 from core.audio_session import RecordingSession
 from gui.recordings_window import RecordingsWindow  # Import the new recordings window
-from core.utils import get_base_path
+from core.utils import get_base_path, cuda_available, default_compute_type
 
 class TranscriptionWorker(QtCore.QThread):
     # This signal will emit the transcription result (a dict) back to the GUI.
@@ -16,11 +16,13 @@ class TranscriptionWorker(QtCore.QThread):
         self.use_local = False
         self.model_size = "base"
         self.device = "cpu"
+        self.compute_type = None
 
-    def set_transcription_params(self, use_local, model_size, device):
+    def set_transcription_params(self, use_local, model_size, device, compute_type=None):
         self.use_local = use_local
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type
 
     def run(self):
         # This call runs in a separate thread so it won't freeze the UI.
@@ -28,7 +30,8 @@ class TranscriptionWorker(QtCore.QThread):
             enable_transcription=True,
             use_local=self.use_local,
             model_size=self.model_size,
-            device=self.device
+            device=self.device,
+            compute_type=self.compute_type
         )
         # Add service type to result
         result['service'] = 'local (faster_whisper)' if self.use_local else 'groq'
@@ -95,6 +98,21 @@ class AudioRecorderGUI(QtWidgets.QMainWindow):
         self.device_combo.addItems(["cpu", "cuda"])  # Removed mps
         device_layout.addWidget(self.device_combo)
         config_layout.addLayout(device_layout)
+
+        # Compute type selection, defaulted for the detected device.
+        compute_type_layout = QtWidgets.QHBoxLayout()
+        compute_type_layout.addWidget(QtWidgets.QLabel("Compute Type:"))
+        self.compute_type_combo = QtWidgets.QComboBox()
+        self.compute_type_combo.addItems(["int8", "int8_float16", "float16", "float32"])
+        compute_type_layout.addWidget(self.compute_type_combo)
+        config_layout.addLayout(compute_type_layout)
+
+        # Default to the GPU when one is available; CPU-only setups are unaffected.
+        self.device_combo.currentTextChanged.connect(
+            lambda device: self.compute_type_combo.setCurrentText(default_compute_type(device))
+        )
+        self.device_combo.setCurrentText("cuda" if cuda_available() else "cpu")
+        self.compute_type_combo.setCurrentText(default_compute_type(self.device_combo.currentText()))
         
         transcribe_layout.addWidget(self.config_container)
         transcribe_group.setLayout(transcribe_layout)
@@ -213,10 +231,11 @@ class AudioRecorderGUI(QtWidgets.QMainWindow):
         use_local = self.local_transcribe_check.isChecked()
         model_size = self.model_combo.currentText()
         device = self.device_combo.currentText()
+        compute_type = self.compute_type_combo.currentText()
         
         # Pass parameters to worker
         self.transcription_worker = TranscriptionWorker(self.session)
-        self.transcription_worker.set_transcription_params(use_local, model_size, device)
+        self.transcription_worker.set_transcription_params(use_local, model_size, device, compute_type)
         self.transcription_worker.transcription_done.connect(self.handle_transcription_done)
         self.transcription_worker.start()
 
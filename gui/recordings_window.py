@@ -1,24 +1,33 @@
 import os
+import re
 from PyQt5 import QtWidgets, QtCore, QtGui
-from core.utils import get_base_path, get_data_path
+from core.utils import get_base_path, get_data_path, cuda_available, default_compute_type, format_timestamp
 
 class RegenerateTranscriptWorker(QtCore.QThread):
     transcription_done = QtCore.pyqtSignal(dict)
     error_occurred = QtCore.pyqtSignal(str)
+    # Emits batches of segment dicts while transcription is still running.
+    segments_ready = QtCore.pyqtSignal(list)
 
-    def __init__(self, session, use_local, model_size=None, device=None):
+    def __init__(self, session, use_local, model_size=None, device=None, compute_type=None):
         super().__init__()
         self.session = session
         self.use_local = use_local
         self.model_size = model_size
         self.device = device
+        self.compute_type = compute_type
 
     def run(self):
         try:
             result = self.session.transcribe(
                 use_local=self.use_local,
                 model_size=self.model_size,
-                device=self.device
+                device=self.device,
+                compute_type=self.compute_type,
+                on_segments=self.segments_ready.emit,
+                # Regenerating re-runs transcription, so the cached merged transcript is bypassed;
+                # chunks finished by an earlier (e.g. crashed) run are still reused.
+                use_cache=False
             )
             self.transcription_done.emit(result)
         except Exception as e:
@@ -80,10 +89,22 @@ class RecordingsWindow(QtWidgets.QMainWindow):
         self.device_combo = QtWidgets.QComboBox()
         self.device_combo.addItems(["cpu", "cuda"])
         self.search_layout.addWidget(self.device_combo)
+
+        self.compute_type_combo = QtWidgets.QComboBox()
+        self.compute_type_combo.addItems(["int8", "int8_float16", "float16", "float32"])
+        self.search_layout.addWidget(self.compute_type_combo)
+
+        # Default to the GPU when one is available, with a compute type to match.
+        self.device_combo.currentTextChanged.connect(
+            lambda device: self.compute_type_combo.setCurrentText(default_compute_type(device))
+        )
+        self.device_combo.setCurrentText("cuda" if cuda_available() else "cpu")
+        self.compute_type_combo.setCurrentText(default_compute_type(self.device_combo.currentText()))
         
         # Initially hide local settings
         self.model_size_combo.hide()
         self.device_combo.hide()
+        self.compute_type_combo.hide()
 
         # Regenerate Transcript Button
         self.regenerate_button = QtWidgets.QPushButton("Regenerate Transcript")
@@ -96,6 +117,12 @@ class RecordingsWindow(QtWidgets.QMainWindow):
         self.transcript_text = QtWidgets.QTextEdit()
         self.transcript_text.setReadOnly(True)
         self.right_layout.addWidget(self.transcript_text)
+
+        # Plain-text snapshot of the transcript used by search; rebuilt lazily after edits.
+        self._plain_text = None
+        # Whether that snapshot holds non-BMP characters, i.e. str indices need UTF-16 conversion.
+        self._needs_utf16 = False
+        self.transcript_text.document().contentsChanged.connect(self._invalidate_plain_text)
         
         self.splitter.addWidget(self.right_panel)
         self.setCentralWidget(self.splitter)
@@ -108,6 +135,8 @@ class RecordingsWindow(QtWidgets.QMainWindow):
 
         # Store a reference to the current worker so it isn't garbage-collected.
         self.regen_worker = None
+        # Document position where the running regeneration's streamed segments begin.
+        self._stream_start = 0
 
     def populate_list(self):
         """
@@ -117,15 +146,14 @@ class RecordingsWindow(QtWidgets.QMainWindow):
         if not os.path.exists(self.recordings_path):
             return
         
-        # List only directories (recording sessions).
-        dirs = [d for d in os.listdir(self.recordings_path) 
-                if os.path.isdir(os.path.join(self.recordings_path, d))]
-        dirs.sort(reverse=True)  # Newest recordings first.
+        # List only directories (recording sessions), newest recordings first.
+        root = self.recordings_path
+        join = os.path.join
+        isdir = os.path.isdir
+        dirs = sorted((d for d in os.listdir(root) if isdir(join(root, d))), reverse=True)
         
         self.list_widget.clear()
-        for d in dirs:
-            item = QtWidgets.QListWidgetItem(d)
-            self.list_widget.addItem(item)
+        self.list_widget.addItems(dirs)
         
     def load_transcript(self, item):
         """
@@ -157,26 +185,51 @@ class RecordingsWindow(QtWidgets.QMainWindow):
             self.transcript_text.setExtraSelections(extraSelections)
             return
         
-        # Start at the beginning of the document.
-        cursor = self.transcript_text.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.Start)
+        # Match against the flat text once instead of walking the document per hit.
+        # QTextDocument.find is case-insensitive by default, so keep that behaviour.
+        document = self.transcript_text.document()
+        if self._plain_text is None:
+            self._plain_text = self.transcript_text.toPlainText()
+            # Cursor positions count UTF-16 code units, which differ from str indices once the
+            # text holds characters outside the BMP (e.g. emoji). The document already counts
+            # UTF-16 units (plus one for its final paragraph separator), so no re-encode is needed.
+            self._needs_utf16 = document.characterCount() - 1 != len(self._plain_text)
+        text = self._plain_text
+        needs_utf16 = self._needs_utf16
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        
+        # Matches arrive in order, so each offset is converted incrementally from the previous one.
+        last_index = last_units = 0
+
+        def position(index):
+            nonlocal last_index, last_units
+            if needs_utf16:
+                last_units += len(text[last_index:index].encode("utf-16-le")) // 2
+                last_index = index
+                return last_units
+            return index
         
-        while True:
-            cursor = self.transcript_text.document().find(query, cursor)
-            if cursor.isNull():
-                break
+        for match in pattern.finditer(text):
+            cursor = QtGui.QTextCursor(document)
+            cursor.setPosition(position(match.start()))
+            cursor.setPosition(position(match.end()), QtGui.QTextCursor.KeepAnchor)
             selection = QtWidgets.QTextEdit.ExtraSelection()
             selection.cursor = cursor
             selection.format.setBackground(QtGui.QColor("yellow"))
             extraSelections.append(selection)
         
         self.transcript_text.setExtraSelections(extraSelections)
+
+    def _invalidate_plain_text(self):
+        """Drop the cached plain-text snapshot whenever the transcript document changes."""
+        self._plain_text = None
     
     def toggle_local_settings(self):
         """Show/hide local transcription settings based on mode selection"""
         is_local = self.transcription_mode.currentText() == "Local (faster_whisper)"
         self.model_size_combo.setVisible(is_local)
         self.device_combo.setVisible(is_local)
+        self.compute_type_combo.setVisible(is_local)
 
     def regenerate_transcript(self):
         """
@@ -192,11 +245,12 @@ class RecordingsWindow(QtWidgets.QMainWindow):
         use_local = self.transcription_mode.currentText() == "Local (faster_whisper)"
         model_size = self.model_size_combo.currentText() if use_local else None
         device = self.device_combo.currentText() if use_local else None
+        compute_type = self.compute_type_combo.currentText() if use_local else None
 
         session_item = selected_items[0]
         session_name = session_item.text()
         self.transcript_text.clear()
-        self.transcript_text.append(f"Starting regeneration for session: '{session_name}'")
+        log_lines = [f"Starting regeneration for session: '{session_name}'"]
 
         session_folder = os.path.join(self.recordings_path, session_name)
 
@@ -204,51 +258,109 @@ class RecordingsWindow(QtWidgets.QMainWindow):
             from core.audio_session import RecordingSession
             # Create a session instance from the existing folder.
             rs = RecordingSession.from_existing_session(session_folder)
-            self.transcript_text.append("Session initialized successfully.")
+            log_lines.append("Session initialized successfully.")
         except Exception as e:
-            self.transcript_text.append(f"Error initializing session: {e}")
+            log_lines.append(f"Error initializing session: {e}")
+            self._batch_append(log_lines)
             return
 
         # Create and start the transcription worker with parameters
-        self.regen_worker = RegenerateTranscriptWorker(rs, use_local, model_size, device)
+        self.regen_worker = RegenerateTranscriptWorker(rs, use_local, model_size, device, compute_type)
         self.regen_worker.transcription_done.connect(lambda result: self.handle_regeneration_done(result, session_item))
         self.regen_worker.error_occurred.connect(self.handle_regeneration_error)
+        self.regen_worker.segments_ready.connect(self.handle_segments_ready)
         
-        self.transcript_text.append("Transcription started...")
+        log_lines.append("Transcription started...")
+        self._batch_append(log_lines)
+        # Streamed segments are appended after this point and replaced by the final transcript.
+        self._stream_start = self.transcript_text.document().characterCount() - 1
         self.regen_worker.start()
     
+    def handle_segments_ready(self, segments):
+        """
+        Append a batch of freshly transcribed segments while regeneration is still running,
+        so text shows up long before the full transcript is merged and saved.
+        """
+        speakers = {"device": "Device", "mic": "Mic"}
+        self._batch_append([
+            f"[{format_timestamp(seg['start'])} - {format_timestamp(seg['end'])}] "
+            f"{speakers.get(seg.get('source'), 'Unknown')}: {seg['text'].strip()}"
+            for seg in segments
+        ])
+
     def handle_regeneration_done(self, result, session_item):
         """
         Handle successful completion of transcript regeneration.
-        Log details and then reload the newly generated transcript.
+        Log details and then display the newly generated transcript.
         """
         try:
             from core.utils import save_transcripts
-            saved_paths = save_transcripts(os.path.join(self.recordings_path, session_item.text()), result)
+            session_folder = os.path.join(self.recordings_path, session_item.text())
+            saved_paths = save_transcripts(session_folder, result)
+            self._clear_streamed_segments()
             
             log_msg = ("Transcript regenerated successfully!\n"
                        f"System: {saved_paths['system']}\n"
                        f"Mic: {saved_paths['mic']}\n")
-            self.transcript_text.append(log_msg)
-            self.transcript_text.append("Reloading transcript from file...")
+            log_lines = [log_msg]
 
-            # Reload transcript based on current transcript selection.
-            transcript_file = "merged_transcript.md" # Assuming merged transcript is saved as merged_transcript.md
-            transcript_path = os.path.join(self.recordings_path, session_item.text(), transcript_file)
-            
-            if os.path.exists(transcript_path):
-                with open(transcript_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-                self.transcript_text.append("\n----- Transcript Content -----\n")
-                self.transcript_text.append(content)
+            # Show the merged transcript that was just written; only fall back to disk
+            # when the saved result does not carry the text.
+            content = saved_paths.get("merged_text")
+            if content is None:
+                log_lines.append("Reloading transcript from file...")
+                transcript_file = "merged_transcript.md" # Assuming merged transcript is saved as merged_transcript.md
+                transcript_path = os.path.join(session_folder, transcript_file)
+                if os.path.exists(transcript_path):
+                    with open(transcript_path, "r", encoding="utf-8") as f:
+                        content = f.read()
+
+            if content is not None:
+                log_lines.append("\n----- Transcript Content -----\n")
+                log_lines.append(content)
             else:
-                self.transcript_text.append(f"No transcript available after regeneration.")
+                log_lines.append(f"No transcript available after regeneration.")
+            self._batch_append(log_lines)
         except Exception as e:
-            self.transcript_text.append(f"Error saving transcripts: {e}")
+            self._batch_append([f"Error saving transcripts: {e}"])
     
+    def _clear_streamed_segments(self):
+        """Remove the segments streamed in during regeneration, keeping the log lines before them."""
+        cursor = QtGui.QTextCursor(self.transcript_text.document())
+        cursor.setPosition(self._stream_start)
+        cursor.movePosition(QtGui.QTextCursor.End, QtGui.QTextCursor.KeepAnchor)
+        cursor.removeSelectedText()
+
     def handle_regeneration_error(self, error_message):
         """
         Handle errors during the transcription process.
         Log the error message to the transcript display area.
         """
-        self.transcript_text.append(f"Error: Transcription failed: {error_message}")
+        self._batch_append([f"Error: Transcription failed: {error_message}"])
+
+    def _batch_append(self, lines):
+        """
+        Append several lines to the transcript display as one edit.
+        Repaints and change signals are suspended until every line is inserted,
+        so the widget lays out and paints once instead of once per line.
+        Like QTextEdit.append, the view follows the new text if it was scrolled to the bottom.
+        """
+        scrollbar = self.transcript_text.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+        self.transcript_text.setUpdatesEnabled(False)
+        self.transcript_text.blockSignals(True)
+        try:
+            cursor = self.transcript_text.textCursor()
+            cursor.movePosition(QtGui.QTextCursor.End)
+            cursor.beginEditBlock()
+            for line in lines:
+                # Mirror QTextEdit.append, which starts a new paragraph for non-empty documents.
+                if not self.transcript_text.document().isEmpty():
+                    cursor.insertBlock()
+                cursor.insertText(line)
+            cursor.endEditBlock()
+        finally:
+            self.transcript_text.blockSignals(False)
+            self.transcript_text.setUpdatesEnabled(True)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
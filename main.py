@@ -1,10 +1,7 @@
-from PyQt5 import QtWidgets
 import sys
-from gui.main_window import AudioRecorderGUI
 import os
 from dotenv import load_dotenv
 from core.utils import get_base_path, get_data_path  # Updated utility import
-import posthog  # Import PostHog
 from pathlib import Path
 
 # Use the utility function for all path operations
@@ -20,19 +17,26 @@ load_dotenv(env_path)
 recordings_folder = os.path.join(get_data_path(), 'recordings')
 os.makedirs(recordings_folder, exist_ok=True)
 
-# Initialize PostHog client
-POSTHOG_API_KEY = os.getenv("POSTHOG_API_KEY")
-posthog_client = None # Initialize as None
-if POSTHOG_API_KEY:
-    posthog_client = posthog.Posthog(
-        POSTHOG_API_KEY,
+def init_posthog():
+    """Create the PostHog client, importing posthog only when telemetry is configured."""
+    posthog_api_key = os.getenv("POSTHOG_API_KEY")
+    if not posthog_api_key:
+        print("POSTHOG_API_KEY not found in environment variables. PostHog will not be initialized.")
+        return None
+    import posthog  # Import PostHog
+    client = posthog.Posthog(
+        posthog_api_key,
         host='https://us.i.posthog.com' # Default PostHog cloud host, change if self-hosting
     )
     print("PostHog initialized.")
-else:
-    print("POSTHOG_API_KEY not found in environment variables. PostHog will not be initialized.")
+    return client
 
 def main():
+    # GUI imports are deferred so importing this module stays cheap.
+    from PyQt5 import QtWidgets
+    from gui.main_window import AudioRecorderGUI
+
+    posthog_client = init_posthog()
     app = QtWidgets.QApplication(sys.argv)
     window = AudioRecorderGUI(posthog_client=posthog_client) # Pass PostHog client to GUI
     window.show()
@@ -43,4 +47,4 @@ def main():
     sys.exit(exit_code)
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
@@ -1,15 +1,152 @@
 import pyaudiowpatch as pyaudio
-import wave
 import time
 import os
+import mmap
+import math
 import numpy as np
+from scipy.signal import resample_poly
+import soundfile as sf
 import noisereduce as nr
 import threading
+import functools
+import atexit
+import ctypes
 from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+
+# Noise reduction runs over blocks of this many seconds, each overlapping the next by
+# NR_OVERLAP_SECONDS so the seam between them can be crossfaded.
+NR_BLOCK_SECONDS = 10
+NR_OVERLAP_SECONDS = 1
+# Blocks quieter than this (-50 dBFS RMS) skip noise reduction and are passed through as-is.
+NR_SILENCE_RMS = 10 ** (-50 / 20)
+
+# PyAudio sample format -> (numpy dtype of the raw samples, factor that maps them to [-1, 1]).
+# Resolved once per buffer, so converting it needs no per-format branches.
+SAMPLE_FORMATS = {
+    pyaudio.paInt16: (np.int16, np.float32(1.0 / 32768.0)),
+    pyaudio.paInt32: (np.int32, np.float32(1.0 / 2147483648.0)),
+    pyaudio.paFloat32: (np.float32, np.float32(1.0)),
+}
+
+# Seconds of capture the callback ring buffer can hold before the drain thread must catch up.
+RING_SECONDS = 8
+# How often the drain thread moves captured audio out of the ring buffer.
+RING_DRAIN_INTERVAL = 0.05
+
+
+class _RingBuffer:
+    """
+    Single-producer/single-consumer byte ring for the PortAudio callback.
+    Storage is allocated once; the producer only advances write_pos and the consumer only
+    advances read_pos, each after its copy is complete, so neither side takes a lock.
+    """
+    def __init__(self, min_capacity):
+        # A power-of-two capacity turns the wrap-around modulo into a mask.
+        self.capacity = 1 << max(0, min_capacity - 1).bit_length()
+        self._mask = self.capacity - 1
+        self._buf = np.zeros(self.capacity, dtype=np.uint8)
+        self._base = self._buf.ctypes.data  # storage never moves, so its address is taken once
+        self.write_pos = 0
+        self.read_pos = 0
+        self.dropped = 0
+
+    def write(self, data):
+        """Copy data in (producer side); drops it and counts the bytes if the ring is full."""
+        n = len(data)
+        if n > self.capacity - (self.write_pos - self.read_pos):
+            self.dropped += n
+            return False
+        start = self.write_pos & self._mask
+        if n <= self.capacity - start:
+            # Common case: one memmove straight from the bytes object, no numpy views created.
+            ctypes.memmove(self._base + start, data, n)
+        else:
+            first = self.capacity - start
+            src = np.frombuffer(data, dtype=np.uint8)
+            self._buf[start:] = src[:first]
+            self._buf[:n - first] = src[first:]
+        self.write_pos += n
+        return True
+
+    def drain_into(self, out):
+        """Append everything written so far to the bytearray out (consumer side)."""
+        end = self.write_pos
+        available = end - self.read_pos
+        if available:
+            start = self.read_pos & self._mask
+            first = min(available, self.capacity - start)
+            out += memoryview(self._buf)[start:start + first]
+            out += memoryview(self._buf)[:available - first]
+            self.read_pos = end
+        return available
+
+# Win32 THREAD_PRIORITY_HIGHEST: above every normal-priority thread, below time-critical.
+THREAD_PRIORITY_HIGHEST = 2
+
+def _raise_thread_priority():
+    """
+    Best effort: run the calling thread above normal priority, so a blocking capture loop
+    keeps up with the device while other threads are busy. Only Windows (the WASAPI
+    platform this recorder targets) is handled; elsewhere this does nothing.
+    """
+    if os.name != "nt":
+        return
+    kernel32 = ctypes.windll.kernel32
+    if not kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_HIGHEST):
+        print("Could not raise capture thread priority")
+
+@functools.lru_cache(maxsize=1)
+def _get_pa():
+    """
+    Return the process-wide PyAudio instance. PortAudio (and WASAPI/COM underneath it)
+    is initialized once on first use and terminated at interpreter exit.
+    """
+    p = pyaudio.PyAudio()
+    atexit.register(p.terminate)
+    return p
+
+@functools.lru_cache(maxsize=1)
+def _wasapi_input_devices():
+    """Enumerate WASAPI input devices once; PortAudio's device list is fixed at initialization anyway."""
+    p = _get_pa()
+    wasapi_host_index = None
+    for i in range(p.get_host_api_count()):
+        api_info = p.get_host_api_info_by_index(i)
+        if api_info.get("type") == pyaudio.paWASAPI:
+            wasapi_host_index = i
+            break
+    device_list = []
+    if wasapi_host_index is not None:
+        for i in range(p.get_device_count()):
+            device_info = p.get_device_info_by_index(i)
+            if device_info.get('hostApi') == wasapi_host_index and device_info.get('maxInputChannels') > 0:
+                device_list.append({
+                    'index': i,
+                    'name': device_info.get('name'),
+                    'defaultSampleRate': device_info.get('defaultSampleRate')
+                })
+    return tuple(device_list)
+
+@functools.lru_cache(maxsize=1)
+def torch_gate_available() -> bool:
+    """Return True when noisereduce's torch backend (PyTorch and TorchGate) is installed and a CUDA device is visible."""
+    try:
+        import torch
+        from noisereduce.torchgate import TorchGate  # noqa: F401
+        return torch.cuda.is_available()
+    except Exception:
+        return False
 
 
 class AudioRecorder:
-    def __init__(self, session_folder="."):
+    def __init__(self, session_folder=".", target_rate=16000, mono=True):
+        """
+        target_rate and mono set the format of the saved recordings. Capture always uses
+        the device's native format; post-processing downmixes to mono and resamples to
+        target_rate before noise reduction, since transcription only needs 16 kHz mono.
+        Pass target_rate=None and mono=False to keep the device's rate and channels.
+        """
         self.CHUNK = 1024 *4
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 2
@@ -18,30 +155,15 @@ class AudioRecorder:
         self.stream = None
         self.session_folder = session_folder
         self.is_recording = False
+        self.target_rate = target_rate
+        self.mono = mono
 
     def list_audio_devices(self):
-        p = pyaudio.PyAudio()
-        wasapi_host_index = None
-        for i in range(p.get_host_api_count()):
-            api_info = p.get_host_api_info_by_index(i)
-            if api_info.get("type") == pyaudio.paWASAPI:
-                wasapi_host_index = i
-                break
-        device_list = []
-        if wasapi_host_index is not None:
-            for i in range(p.get_device_count()):
-                device_info = p.get_device_info_by_index(i)
-                if device_info.get('hostApi') == wasapi_host_index and device_info.get('maxInputChannels') > 0:
-                    device_list.append({
-                        'index': i,
-                        'name': device_info.get('name'),
-                        'defaultSampleRate': device_info.get('defaultSampleRate')
-                    })
-        p.terminate()
-        return device_list
+        # Copies, so callers can't modify the cached enumeration.
+        return [dict(device) for device in _wasapi_input_devices()]
 
     def start_recording(self, device_index=None):
-        self.p = pyaudio.PyAudio()
+        self.p = _get_pa()
         if device_index is None:
             devices = self.list_audio_devices()
             loopback_devices = [d for d in devices if "Loopback" in d['name']]
@@ -55,6 +177,11 @@ class AudioRecorder:
         if self.CHANNELS < 1:
             self.CHANNELS = 2
         print(f"Using sample rate: {self.RATE}, channels: {self.CHANNELS} from device: {device_info.get('name')}")
+        # The callback only copies into a preallocated ring; a drain thread appends it to
+        # self.frames, so the real-time thread never allocates or resizes a buffer.
+        bytes_per_second = self.RATE * self.CHANNELS * self.p.get_sample_size(self.FORMAT)
+        self.ring = _RingBuffer(bytes_per_second * RING_SECONDS)
+        self.frames = bytearray()
         self.stream = self.p.open(
             format=self.FORMAT,
             channels=self.CHANNELS,
@@ -64,64 +191,40 @@ class AudioRecorder:
             input_device_index=device_index,
             stream_callback=self._callback
         )
-        self.frames = []
+        # Started only once the device is open, so a failed open leaves no thread running.
+        self._draining = True
+        self._drain_thread = threading.Thread(target=self._drain_ring, daemon=True)
+        self._drain_thread.start()
         self.stream.start_stream()
         print("Recording started...")
 
     def _callback(self, in_data, frame_count, time_info, status):
-        self.frames.append(in_data)
+        self.ring.write(in_data)
         return (in_data, pyaudio.paContinue)
 
+    def _drain_ring(self):
+        while self._draining:
+            self.ring.drain_into(self.frames)
+            time.sleep(RING_DRAIN_INTERVAL)
+
     def stop_recording(self):
         if self.stream:
             self.stream.stop_stream()
             self.stream.close()
-        if self.p:
-            self.p.terminate()
-        folder = self.session_folder
-        filename = os.path.join(folder, "recording.wav")
-        raw_audio = b''.join(self.frames)
-        audio_data = np.frombuffer(raw_audio, dtype=np.float32)
-        if self.CHANNELS > 1:
-            audio_data = np.reshape(audio_data, (-1, self.CHANNELS))
-        noise_sample_length = self.RATE
-        if audio_data.shape[0] > noise_sample_length:
-            noise_clip = audio_data[:noise_sample_length]
-        else:
-            noise_clip = audio_data
-        if audio_data.ndim == 2 and audio_data.shape[1] > 1:
-            audio_data_t = audio_data.T
-            noise_clip_t = noise_clip.T
-            reduced_channels = []
-            for ch in range(audio_data_t.shape[0]):
-                reduced_channel = nr.reduce_noise(
-                    y=audio_data_t[ch],
-                    y_noise=noise_clip_t[ch],
-                    sr=self.RATE
-                )
-                reduced_channels.append(reduced_channel)
-            reduced_audio = np.vstack(reduced_channels).T
-        else:
-            reduced_audio = nr.reduce_noise(
-                y=audio_data,
-                y_noise=noise_clip,
-                sr=self.RATE
-            )
-        reduced_audio_clipped = np.clip(reduced_audio, -1.0, 1.0)
-        final_audio = (reduced_audio_clipped * 32767).astype(np.int16)
-        wf = wave.open(filename, 'wb')
-        output_channels = 1 if final_audio.ndim == 1 else final_audio.shape[1]
-        wf.setnchannels(output_channels)
-        wf.setsampwidth(2)
-        wf.setframerate(self.RATE)
-        wf.writeframes(final_audio.tobytes())
-        wf.close()
+        self._draining = False
+        self._drain_thread.join()
+        self.ring.drain_into(self.frames)
+        if self.ring.dropped:
+            print(f"Warning: dropped {self.ring.dropped} bytes of audio because the capture buffer was full")
+        filename = self._post_process_and_save(
+            (self.frames, self.RATE, self.CHANNELS, self.FORMAT), "recording.flac"
+        )
         print(f"Recording saved as {filename}")
         return filename
 
     def trigger_mic_profile_switch(self, mic_device_index, duration=2):
         print("Triggering microphone profile switch...")
-        p = pyaudio.PyAudio()
+        p = _get_pa()
         try:
             info = p.get_device_info_by_index(mic_device_index)
             channels = int(info.get('maxInputChannels'))
@@ -140,23 +243,15 @@ class AudioRecorder:
             stream.close()
         except Exception as e:
             print(f"Error during profile switch: {e}")
-        finally:
-            p.terminate()
         print("Profile switch complete.")
 
     def _record_stream(self, device_index, format, channels, rate, queue, stream_type):
         """
-        Modified _record_stream method with periodic flushing.
-        This method records audio from a given device and, every `flush_interval` seconds,
-        writes the current frames to a temporary file in the session folder. 
-        At the end of the recording, all segments are merged and the temporary files are removed.
+        Record audio from a given device, appending every read straight to one raw
+        capture file in the session folder. The file's path is handed to post-processing,
+        which maps it instead of reading it back, and removes it once the output file is saved.
         """
-        import time  # ensure time is imported here if not already
-
-        segment_files = []         # List to store flushed segment file names.
-        current_frames = []        # Buffer to accumulate frames between flushes.
-        flush_interval = 60        # Flush every 60 seconds. Adjust as needed.
-        last_flush_time = time.time()
+        raw_path = os.path.join(self.session_folder, f"temp_{stream_type}.raw")
 
         try:
             # Choose a smaller chunk size for system audio if desired.
@@ -172,117 +267,222 @@ class AudioRecorder:
                 "frames_per_buffer": chunk_size
             }
 
+            _raise_thread_priority()
             # Open the stream using the shared PyAudio instance (self.p).
             stream = self.p.open(**stream_kwargs)
             print(f"Started recording {stream_type}")
-            while self.is_recording:
-                try:
-                    # Read and buffer the incoming audio frames.
-                    data = stream.read(chunk_size, exception_on_overflow=False)
-                    current_frames.append(data)
-                    
-                    # Check if it's time to flush the buffer to disk.
-                    if time.time() - last_flush_time >= flush_interval:
-                        # Construct a temporary filename.
-                        segment_filename = f"temp_{stream_type}_{int(time.time())}.raw"
-                        full_path = os.path.join(self.session_folder, segment_filename)
-                        # Write the buffered data to disk.
-                        with open(full_path, "wb") as f:
-                            f.write(b"".join(current_frames))
-                        segment_files.append(full_path)
-                        print(f"Flushed {stream_type} segment to {full_path}")
-                        # Clear the in-memory buffer and update the last flush time.
-                        current_frames = []
-                        last_flush_time = time.time()
-                except Exception as e:
-                    print(f"Error reading from {stream_type}: {e}")
-                    break  # Exit loop if there is a read error.
-
-            # After the recording stops, flush any remaining frames.
-            if current_frames:
-                segment_filename = f"temp_{stream_type}_{int(time.time())}.raw"
-                full_path = os.path.join(self.session_folder, segment_filename)
-                with open(full_path, "wb") as f:
-                    f.write(b"".join(current_frames))
-                segment_files.append(full_path)
-                print(f"Flushed final {stream_type} segment to {full_path}")
+            # A 1 MiB write buffer turns the small reads into large sequential writes.
+            with open(raw_path, "wb", buffering=1 << 20) as raw_file:
+                while self.is_recording:
+                    try:
+                        raw_file.write(stream.read(chunk_size, exception_on_overflow=False))
+                    except Exception as e:
+                        print(f"Error reading from {stream_type}: {e}")
+                        break  # Exit loop if there is a read error.
 
             stream.stop_stream()
             stream.close()
 
-            # Merge all flushed segments into a single buffer.
-            merged_frames = b"".join([open(seg, "rb").read() for seg in segment_files])
-
-            # Optionally clean up the temporary segment files.
-            for seg in segment_files:
-                try:
-                    os.remove(seg)
-                except Exception as ee:
-                    print(f"Could not remove temporary file {seg}: {ee}")
-
-            # Pass a list with the merged buffer to the processing function.
-            queue.put(([merged_frames], rate, channels, format))
+            # Pass the raw capture file to the processing function.
+            queue.put((raw_path, rate, channels, format))
             print(f"Finished recording {stream_type}")
         except Exception as e:
             print(f"Error setting up {stream_type} stream: {e}")
             queue.put(None)
 
-    def _post_process_and_save(self, stream_data, filename):
-        frames, rate, channels, format = stream_data
-        if format == pyaudio.paFloat32:
-            audio_data = np.frombuffer(b''.join(frames), dtype=np.float32)
+    def _reduce_noise(self, block, noise_clip, rate):
+        """
+        Noise-reduce one (channels, frames) block against a fixed (channels, frames) noise clip
+        with noisereduce's stationary spectral gate, run on the GPU through its torch backend
+        when CUDA is available. Both devices run the same gate, so the saved audio does not
+        depend on which one was used.
+        """
+        if torch_gate_available():
+            options = dict(use_torch=True, device="cuda")
         else:
-            audio_data = np.frombuffer(b''.join(frames), dtype=np.int16).astype(np.float32) / 32768.0
-        if channels > 1:
-            audio_data = np.reshape(audio_data, (-1, channels))
-        if audio_data.shape[0] > rate:
-            noise_sample = audio_data[:rate]
-            if audio_data.ndim == 2:
-                reduced_channels = []
-                for ch in range(channels):
-                    reduced_channel = nr.reduce_noise(
-                        y=audio_data[:, ch],
-                        y_noise=noise_sample[:, ch],
-                        sr=rate
-                    )
-                    reduced_channels.append(reduced_channel)
-                reduced_audio = np.stack(reduced_channels, axis=1)
+            options = dict(n_jobs=-1)
+        if block.shape[0] == 1:
+            return nr.reduce_noise(y=block[0], y_noise=noise_clip[0], sr=rate, stationary=True, **options)[None, :]
+        # noisereduce filters all channels of a (channels, frames) array in one call. Each
+        # channel is already a contiguous row, so its STFT never reads strided samples.
+        return nr.reduce_noise(y=block, y_noise=noise_clip, sr=rate, stationary=True, **options)
+
+    @staticmethod
+    def _block_rms(block):
+        """RMS level of a (channels, frames) block; a BLAS dot per contiguous row, no temporaries."""
+        if block.size == 0:
+            return 0.0
+        return math.sqrt(sum(float(np.dot(row, row)) for row in block) / block.size)
+
+    def _iter_denoised_blocks(self, audio_data, rate):
+        """
+        Yield the noise-reduced (channels, frames) recording block by block, so only one
+        block's worth of intermediate arrays is alive at a time. The first second is the noise
+        profile for every block; each block overlaps the next by NR_OVERLAP_SECONDS and the
+        overlap is linearly crossfaded into the following block. Near-silent blocks are not
+        noise-reduced at all.
+        """
+        noise_clip = audio_data[:, :rate]
+        step = NR_BLOCK_SECONDS * rate
+        overlap = NR_OVERLAP_SECONDS * rate
+        total = audio_data.shape[1]
+        fade_in = np.linspace(0.0, 1.0, overlap, dtype=np.float32)
+        prev_tail = None
+        for start in range(0, total, step):
+            stop = min(start + step + overlap, total)
+            block = audio_data[:, start:stop]
+            if self._block_rms(block) < NR_SILENCE_RMS:
+                # Nothing worth gating; a copy keeps the crossfade below from writing into audio_data.
+                reduced = block.copy()
             else:
-                reduced_audio = nr.reduce_noise(
-                    y=audio_data,
-                    y_noise=noise_sample,
-                    sr=rate
-                )
-        else:
-            reduced_audio = audio_data
-        reduced_audio = np.clip(reduced_audio, -1.0, 1.0)
-        final_audio = (reduced_audio * 32767).astype(np.int16)
+                reduced = self._reduce_noise(block, noise_clip, rate)
+            if prev_tail is not None:
+                reduced[:, :overlap] = prev_tail * (1.0 - fade_in) + reduced[:, :overlap] * fade_in
+            if stop == total:
+                yield reduced
+                return
+            prev_tail = reduced[:, -overlap:]
+            yield reduced[:, :-overlap]
+
+    def _post_process_and_save(self, stream_data, filename):
+        """
+        Noise-reduce captured audio and save it as filename in the session folder.
+        The captured audio is either an in-memory buffer or the path of a raw capture file;
+        a file is memory-mapped so the OS pages it in as it is processed, and is deleted
+        only once the output file has been saved, so a failed save keeps the capture.
+        Raises RuntimeError if no audio was captured.
+        """
+        frames, rate, channels, format = stream_data
         output_path = os.path.join(self.session_folder, filename)
-        wf = wave.open(output_path, 'wb')
-        wf.setnchannels(channels)
-        wf.setsampwidth(2)
-        wf.setframerate(rate)
-        wf.writeframes(final_audio.tobytes())
-        wf.close()
+        if not isinstance(frames, str):
+            self._write_denoised(frames, rate, channels, format, output_path)
+        else:
+            with open(frames, "rb") as f:
+                # mmap cannot map an empty file.
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if os.fstat(f.fileno()).st_size else None
+            if mapped is None:
+                # Nothing was captured, so there is no recording to keep.
+                os.remove(frames)
+                raise RuntimeError(f"No audio captured for {filename}")
+            try:
+                self._write_denoised(mapped, rate, channels, format, output_path)
+            finally:
+                try:
+                    mapped.close()
+                    released = True
+                except BufferError:
+                    # An exception in flight still references a view; the map closes when it is
+                    # collected. Until then Windows cannot delete the file, so it is left alone.
+                    released = False
+            if released:
+                os.remove(frames)
         print(f"Processed and saved {filename}")
+        return output_path
+
+    @staticmethod
+    def _deinterleave(frames, channels, format):
+        """
+        Split an interleaved capture buffer into a (channels, frames) float32 array in [-1, 1].
+        Each channel is read with a strided view and scaled straight into its own contiguous
+        row, so deinterleaving and sample conversion happen in one pass per channel.
+        """
+        try:
+            dtype, scale = SAMPLE_FORMATS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported PyAudio sample format: {format}")
+        samples = np.frombuffer(frames, dtype=dtype)
+        frame_count = samples.size // channels
+        audio_data = np.empty((channels, frame_count), dtype=np.float32)
+        for ch in range(channels):
+            np.multiply(samples[ch:frame_count * channels:channels], scale, out=audio_data[ch])
+        return audio_data
+
+    @staticmethod
+    def _to_pcm16(block, scratch, out):
+        """
+        Convert a (channels, frames) float block in [-1, 1] to interleaved int16 samples in out
+        (shaped (frames, channels)), using scratch (same shape as block, float32) for the
+        intermediate: scale, clip in the int16 domain, then cast while re-interleaving.
+        """
+        np.multiply(block, np.float32(32767.0), out=scratch)
+        np.clip(scratch, -32767.0, 32767.0, out=scratch)
+        np.copyto(out, scratch.T, casting='unsafe')
+
+    def _write_denoised(self, frames, rate, channels, format, output_path):
+        # Channels are processed as contiguous rows (SoA) and only re-interleaved for the output file.
+        audio_data = self._deinterleave(frames, channels, format)
+        # libsndfile leaves a zero-frame FLAC as an empty file it cannot reopen, so fail here with a clear error instead.
+        if audio_data.shape[1] == 0:
+            raise RuntimeError(f"No audio captured for {os.path.basename(output_path)}")
+        # Shrink the data before noise reduction rather than after: downmix first, then
+        # resample the single remaining row with a polyphase filter.
+        if self.mono and audio_data.shape[0] > 1:
+            audio_data = audio_data.mean(axis=0, keepdims=True, dtype=np.float32)
+        if self.target_rate and rate != self.target_rate:
+            divisor = math.gcd(rate, self.target_rate)
+            audio_data = resample_poly(
+                audio_data, self.target_rate // divisor, rate // divisor, axis=1
+            ).astype(np.float32, copy=False)
+            rate = self.target_rate
+        channels = audio_data.shape[0]
+        if audio_data.shape[1] > rate:
+            blocks = self._iter_denoised_blocks(audio_data, rate)
+        else:
+            blocks = [audio_data]
+        # The file is written under a .tmp name and renamed into place once complete, so a failed
+        # save never leaves a truncated recording for a later session load to pick up.
+        temp_path = output_path + ".tmp"
+        file_format = os.path.splitext(output_path)[1].lstrip(".").upper()
+        try:
+            self._write_pcm16_blocks(blocks, temp_path, rate, channels, file_format)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        os.replace(temp_path, output_path)
+
+    def _write_pcm16_blocks(self, blocks, path, rate, channels, file_format):
+        """Convert (channels, frames) float blocks to 16-bit PCM and append them to a new audio file."""
+        # libsndfile writes the int16 buffers directly (no tobytes() copy) and, being a C call,
+        # releases the GIL while it does.
+        with sf.SoundFile(path, 'w', samplerate=rate, channels=channels, subtype='PCM_16',
+                          format=file_format) as out_file:
+            # Each block is converted and appended as soon as it is denoised. The write runs on a
+            # single background thread so it overlaps denoising of the next block; waiting for the
+            # previous write before queueing the next keeps at most two blocks in flight.
+            # Conversion reuses one float32 scratch buffer and two int16 buffers (one may still be
+            # being written) for the whole recording, so blocks allocate nothing.
+            scratch = np.empty(0, dtype=np.float32)
+            pcm_buffers = [np.empty(0, dtype=np.int16), np.empty(0, dtype=np.int16)]
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                pending = None
+                for index, block in enumerate(blocks):
+                    n = block.size
+                    if scratch.size < n:
+                        scratch = np.empty(n, dtype=np.float32)
+                    if pcm_buffers[index % 2].size < n:
+                        pcm_buffers[index % 2] = np.empty(n, dtype=np.int16)
+                    pcm = pcm_buffers[index % 2][:n].reshape(block.shape[::-1])
+                    self._to_pcm16(block, scratch[:n].reshape(block.shape), pcm)
+                    if pending is not None:
+                        pending.result()
+                    pending = writer.submit(out_file.write, pcm)
+                if pending is not None:
+                    pending.result()
 
     def start_dual_streams(self, system_device_index, mic_device_index):
         if system_device_index is None:
             raise ValueError("No system audio device selected. Please choose a system audio device manually.")
         
-        # Create a shared PyAudio instance for both streams.
-        self.p = pyaudio.PyAudio()
+        # Both streams are opened on the process-wide PyAudio instance.
+        self.p = _get_pa()
         
-        try:
-            sys_info = self.p.get_device_info_by_index(system_device_index)
-            sys_channels = int(sys_info.get('maxInputChannels'))
-            sys_rate = int(sys_info.get('defaultSampleRate'))
-            mic_info = self.p.get_device_info_by_index(mic_device_index)
-            mic_channels = int(mic_info.get('maxInputChannels'))
-            mic_rate = int(mic_info.get('defaultSampleRate'))
-        except Exception as e:
-            self.p.terminate()
-            raise e
+        sys_info = self.p.get_device_info_by_index(system_device_index)
+        sys_channels = int(sys_info.get('maxInputChannels'))
+        sys_rate = int(sys_info.get('defaultSampleRate'))
+        mic_info = self.p.get_device_info_by_index(mic_device_index)
+        mic_channels = int(mic_info.get('maxInputChannels'))
+        mic_rate = int(mic_info.get('defaultSampleRate'))
 
         system_queue = Queue()
         mic_queue = Queue()
@@ -304,12 +504,13 @@ class AudioRecorder:
         system_data = system_queue.get()
         mic_data = mic_queue.get()
         if system_data is None or mic_data is None:
-            self.p.terminate()
             raise RuntimeError("Recording failed for one or both streams")
         
-        self._post_process_and_save(system_data, "system_audio.wav")
-        self._post_process_and_save(mic_data, "mic_audio.wav")
-        
-        # Terminate the shared PyAudio instance once done.
-        self.p.terminate()
-        return os.path.join(self.session_folder, "system_audio.wav"), os.path.join(self.session_folder, "mic_audio.wav") 
\ No newline at end of file
+        # The two streams are independent, so they are noise-reduced and written side by side;
+        # the FFT-heavy work releases the GIL.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            system_future = executor.submit(self._post_process_and_save, system_data, "system_audio.flac")
+            mic_future = executor.submit(self._post_process_and_save, mic_data, "mic_audio.flac")
+            system_path = system_future.result()
+            mic_path = mic_future.result()
+        return system_path, mic_path
\ No newline at end of file
@@ -1,33 +1,106 @@
 import os
-import json
 import time
+import asyncio
 import subprocess
 import tempfile
 import re
-from datetime import datetime
+import heapq
+import bisect
+import hashlib
+import random
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
+import orjson
+import soundfile as sf
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from pathlib import Path
-from core.utils import get_base_path, get_ffmpeg_path, get_ffprobe_path
+from core.utils import get_base_path, get_ffmpeg_path, get_ffprobe_path, format_timestamp, default_compute_type, _write_atomic
 
-# Configure environment BEFORE importing pydub
+# Make the bundled FFmpeg binaries discoverable on PATH
 bin_dir = Path(get_ffmpeg_path()).parent
 os.environ["PATH"] = f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}"
 
-# Now import pydub
-from pydub import AudioSegment
-from groq import Groq, RateLimitError
-from typing import Literal
-from faster_whisper import WhisperModel
-
-# Directly configure pydub's paths
-AudioSegment.converter = get_ffmpeg_path()
-AudioSegment.ffprobe = get_ffprobe_path()
+from typing import Literal, Optional, TYPE_CHECKING
+
+# groq (httpx, pydantic) and faster_whisper (ctranslate2) are imported where they are first
+# used, so importing this module only pays for the backend a transcriber actually selects.
+if TYPE_CHECKING:
+    from groq import Groq
+
+# Sample rate produced by preprocess_audio and expected by Whisper.
+SAMPLE_RATE = 16000
+
+# Number of local Whisper segments forwarded to on_segments at a time.
+SEGMENT_BATCH_SIZE = 20
+
+# Session subfolder holding 16kHz mono FLAC conversions keyed by source content.
+PREPROCESS_CACHE_DIR = ".preproc_cache"
+# Session subfolder holding per-chunk transcription results keyed by chunk audio and backend.
+CHUNK_CACHE_DIR = ".chunk_cache"
+# Session subfolder holding merged transcription results keyed by source audio and settings.
+RESULT_CACHE_DIR = ".result_cache"
+GROQ_MODEL = "whisper-large-v3"
+# Chunks where no SILENCE_FRAME_MS frame reaches this 16-bit RMS are treated as silence and never transcribed.
+SILENCE_RMS_THRESHOLD = 50
+SILENCE_FRAME_MS = 30
+# Part of every cache key, so results produced under different gate settings are never reused.
+_SILENCE_GATE_ID = f"silence={SILENCE_RMS_THRESHOLD}/{SILENCE_FRAME_MS}ms"
+# Splits text into word tokens that keep their leading whitespace.
+_WORD_SPLIT = re.compile(r'(\s+\w+)')
+
+def _cheap_fingerprint(path: Path) -> str:
+    """
+    Fingerprint a file from its size, mtime and first/last 1 MiB.
+    Reads at most 2 MiB regardless of file size; fine for a per-session cache key.
+    """
+    path = Path(path)
+    st = path.stat()
+    block = 1 << 20
+    with open(path, 'rb') as f:
+        head = f.read(block)
+        f.seek(-min(block, st.st_size), os.SEEK_END)
+        tail = f.read()
+    return hashlib.sha256(f"{st.st_size}|{st.st_mtime_ns}".encode() + head + tail).hexdigest()
+
+# Upper bound on in-flight Groq requests across all transcribers in the process.
+GROQ_MAX_CONCURRENT_REQUESTS = 8
+_groq_request_slots = threading.BoundedSemaphore(GROQ_MAX_CONCURRENT_REQUESTS)
+# Dropped connections, timeouts and 5xx responses are retried this many times before the error is raised.
+GROQ_MAX_RETRIES = 6
+# Rate-limited requests keep retrying until this many seconds have been spent waiting on them,
+# since per-minute and audio-seconds limits can take several minutes to clear.
+GROQ_RATE_LIMIT_BUDGET = 30 * 60
+
+@functools.lru_cache(maxsize=4)
+def _get_groq_client(api_key: str) -> "Groq":
+    """
+    Return the Groq client shared by every transcriber using api_key, so its connection
+    pool (and the TCP/TLS sessions in it) stays warm across chunks and recordings.
+    Retries are handled in _call_groq_api, so the SDK's own retries are disabled.
+    HTTP/2 lets concurrent chunk uploads share one TLS connection instead of opening one each.
+    """
+    from groq import Groq, DefaultHttpxClient
+    return Groq(api_key=api_key, max_retries=0, http_client=DefaultHttpxClient(http2=True))
 
 class AudioTranscriber:
     def __init__(self, audio_path: Path, chunk_length: int = 600, overlap: int = 10, 
                  session_folder: Path = None, use_local: bool = False,
-                 model_size: str = "base", device: str = "cpu"):
+                 model_size: str = "base", device: str = "cpu", vad_filter: bool = True,
+                 compute_type: str = None, on_segments=None, max_concurrency: int = 4,
+                 use_cache: bool = True):
         """
         Initialize the AudioTranscriber with the given parameters.
+        vad_filter strips silence with Silero VAD before local Whisper inference.
+        compute_type defaults to float16 on CUDA and int8 on CPU.
+        on_segments, if given, is called with lists of segment dicts (start, end, text,
+        on the full-recording timeline) as soon as they are transcribed.
+        max_concurrency caps how many chunks are sent to Groq at once; local
+        transcription always runs chunks one at a time on the shared model.
+        use_cache=False ignores a cached merged transcript and transcribes again. Per-chunk
+        results are still reused, so a rerun after a crash only transcribes missing chunks.
         """
         self.audio_path = audio_path
         self.chunk_length = chunk_length  # in seconds
@@ -36,24 +109,55 @@ class AudioTranscriber:
         self.session_folder.mkdir(parents=True, exist_ok=True)
         
         self.use_local = use_local
+        self.vad_filter = vad_filter
+        self.on_segments = on_segments
+        self.max_concurrency = max_concurrency
+        self.use_cache = use_cache
+        compute_type = compute_type or default_compute_type(device)
+        # Identifies the model configuration and silence gate in cache keys.
+        if use_local:
+            self.backend_id = f"local|{model_size}|{device}|{compute_type}|en|vad={vad_filter}"
+        else:
+            self.backend_id = f"groq|{GROQ_MODEL}|en"
+        self.backend_id += f"|{_SILENCE_GATE_ID}"
         if use_local:
+            from faster_whisper import WhisperModel
             self.whisper_model = WhisperModel(
                 model_size,
                 device=device,
-                compute_type="float16" if device == "cuda" else "int8"
+                compute_type=compute_type
             )
         else:
             self.api_key = os.getenv("GROQ_API_KEY")
             if not self.api_key:
                 raise ValueError("GROQ_API_KEY environment variable not set")
-            self.client = Groq(api_key=self.api_key, max_retries=0)
+            self.client = _get_groq_client(self.api_key)
 
     def preprocess_audio(self) -> Path:
         """
         Preprocess audio file to 16kHz mono FLAC for transcription.
+        Recordings that are already 16kHz mono FLAC (as AudioRecorder saves them) are used
+        as-is. Other conversions are cached in the session folder, keyed by the source contents
+        and target format, so re-transcribing an unchanged file skips FFmpeg entirely.
         """
         if not self.audio_path.exists():
             raise FileNotFoundError(f"Input file not found: {self.audio_path}")
+
+        # A second, identical copy of the recording would only double the session's disk use.
+        try:
+            info = sf.info(str(self.audio_path))
+            if info.format == "FLAC" and info.samplerate == SAMPLE_RATE and info.channels == 1:
+                return self.audio_path
+        except RuntimeError:
+            pass  # Not a format libsndfile reads; FFmpeg converts it below.
+
+        cache_dir = self.session_folder / PREPROCESS_CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_key = hashlib.sha256(f"{_cheap_fingerprint(self.audio_path)}|16000|1|flac".encode()).hexdigest()
+        output_path = cache_dir / f"{cache_key}.flac"
+        if output_path.exists():
+            print(f"Using cached preprocessed audio: {output_path}")
+            return output_path
         
         # Verify FFmpeg binaries before proceeding
         ffmpeg_path = get_ffmpeg_path()
@@ -66,8 +170,8 @@ class AudioTranscriber:
         if not os.path.exists(ffprobe_path):
             raise FileNotFoundError(f"FFprobe binary not found at: {ffprobe_path}")
 
-        with tempfile.NamedTemporaryFile(suffix='.flac', delete=False) as temp_file:
-            output_path = Path(temp_file.name)
+        # Write next to the cache entry and rename into place so a partial file is never reused.
+        temp_path = cache_dir / f"{cache_key}.flac.tmp"
         
         print("Converting audio to 16kHz mono FLAC...")
         
@@ -84,44 +188,197 @@ class AudioTranscriber:
                 '-ar', '16000',
                 '-ac', '1',
                 '-c:a', 'flac',
+                '-threads', '0',
+                '-f', 'flac',
                 '-y',
-                str(output_path)
+                str(temp_path)
             ], check=True, env=env)
+            os.replace(temp_path, output_path)
             return output_path
         except subprocess.CalledProcessError as e:
-            output_path.unlink(missing_ok=True)
+            temp_path.unlink(missing_ok=True)
             raise RuntimeError(f"FFmpeg conversion failed: {str(e)}")
 
     def _call_groq_api(self, audio_file: Path) -> dict:
-        """Handle Groq API call with retry logic"""
+        """
+        Handle Groq API call with retry logic.
+        The raw verbose_json body is decoded with orjson into plain dicts, skipping the SDK's
+        stdlib json parse and pydantic model construction for every segment.
+        """
+        from groq import RateLimitError, APIConnectionError, InternalServerError
+        # Transient failures worth retrying: 429s, dropped connections and timeouts, and 5xx responses.
+        # Anything else (bad key, invalid file) is raised immediately.
+        rate_limit_waited = 0.0
+        rate_limit_hits = 0
+        failures = 0
         with open(audio_file, 'rb') as f:
             while True:
+                # Reuse the open upload on retries, rewound since a failed attempt may have consumed it.
+                f.seek(0)
                 try:
-                    return self.client.audio.transcriptions.create(
-                        file=("chunk.flac", f, "audio/flac"),
-                        model="whisper-large-v3",
-                        language="en",
-                        response_format="verbose_json"
-                    )
-                except RateLimitError:
-                    print("\nRate limit hit - retrying in 60 seconds...")
-                    time.sleep(60)
-
-    def _call_local_whisper(self, audio_file: Path) -> dict:
+                    with _groq_request_slots:
+                        response = self.client.audio.transcriptions.with_raw_response.create(
+                            file=("chunk.flac", f, "audio/flac"),
+                            model=GROQ_MODEL,
+                            language="en",
+                            response_format="verbose_json"
+                        )
+                    data = orjson.loads(response.http_response.content)
+                    return {"text": data["text"], "segments": data.get("segments") or []}
+                except RateLimitError as e:
+                    # Wait as long as Groq asks; otherwise back off exponentially up to a minute.
+                    # Jitter keeps parallel chunks from retrying in lockstep.
+                    retry_after = self._retry_after_seconds(e.response)
+                    delay = retry_after if retry_after is not None else min(60, 2 ** rate_limit_hits)
+                    delay += random.uniform(0, 1)
+                    rate_limit_hits += 1
+                    if rate_limit_waited + delay > GROQ_RATE_LIMIT_BUDGET:
+                        raise
+                    rate_limit_waited += delay
+                    print(f"\nRate limit hit - retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
+                except (APIConnectionError, InternalServerError) as e:
+                    if failures == GROQ_MAX_RETRIES:
+                        raise
+                    delay = min(60, 2 ** failures) + random.uniform(0, 1)
+                    failures += 1
+                    print(f"\n{type(e).__name__} - retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
+
+    @staticmethod
+    def _retry_after_seconds(response) -> Optional[float]:
+        """Read a 429 response's Retry-After header, given either in seconds or as an HTTP date"""
+        value = response.headers.get("retry-after") if response is not None else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _chunk_to_array(chunk: np.ndarray) -> np.ndarray:
+        """Convert a 16-bit PCM chunk into the float32 waveform faster-whisper expects"""
+        return chunk.astype(np.float32) / 32768.0
+
+    @staticmethod
+    def _load_pcm16(audio_file: Path) -> np.ndarray:
+        """Decode a preprocessed (16kHz mono) file to 16-bit PCM samples with FFmpeg"""
+        completed = subprocess.run([
+            get_ffmpeg_path(),
+            '-hide_banner',
+            '-loglevel', 'error',
+            '-i', str(audio_file),
+            '-f', 's16le',
+            '-ac', '1',
+            '-ar', str(SAMPLE_RATE),
+            '-'
+        ], check=True, capture_output=True)
+        return np.frombuffer(completed.stdout, dtype=np.int16)
+
+    @staticmethod
+    def _is_silent(samples: np.ndarray) -> bool:
+        """
+        Return True if no SILENCE_FRAME_MS frame of a 16-bit PCM chunk reaches SILENCE_RMS_THRESHOLD.
+        Gating on short frames rather than the whole chunk keeps a few seconds of speech in an
+        otherwise quiet chunk from being averaged away. The scan stops at the first loud frame.
+        """
+        frame = SAMPLE_RATE * SILENCE_FRAME_MS // 1000
+        # Compare per-frame sums of squares against the threshold, so no square root is needed.
+        limit = SILENCE_RMS_THRESHOLD ** 2
+        block = frame * 2048
+        for start in range(0, samples.size, block):
+            squares = np.square(samples[start:start + block], dtype=np.int64)
+            whole = squares.size - squares.size % frame
+            if whole and squares[:whole].reshape(-1, frame).sum(axis=1).max() >= limit * frame:
+                return False
+            # A trailing partial frame is judged on its own length.
+            if whole < squares.size and squares[whole:].mean() >= limit:
+                return False
+        return True
+
+    @staticmethod
+    def _probe_duration_ms(audio_file: Path) -> int:
+        """Read an audio file's duration in milliseconds with FFprobe"""
+        completed = subprocess.run([
+            get_ffprobe_path(),
+            '-v', 'error',
+            '-show_entries', 'format=duration',
+            '-of', 'default=noprint_wrappers=1:nokey=1',
+            str(audio_file)
+        ], check=True, capture_output=True, text=True)
+        return int(float(completed.stdout.strip()) * 1000)
+
+    def _cut_chunk(self, audio_file: Path, start_ms: int, end_ms: int) -> Path:
+        """
+        Stream-copy one time range of the preprocessed FLAC into its own temporary file.
+        FLAC frames are copied as-is, so the cut lands on a frame boundary (a fraction of a second).
+        """
+        temp_file = tempfile.NamedTemporaryFile(suffix=".flac", delete=False, dir=str(self.session_folder))
+        temp_file.close()
+        try:
+            subprocess.run([
+                get_ffmpeg_path(),
+                '-hide_banner',
+                '-loglevel', 'error',
+                '-ss', f"{start_ms / 1000:.3f}",
+                '-i', str(audio_file),
+                '-t', f"{(end_ms - start_ms) / 1000:.3f}",
+                '-c', 'copy',
+                '-y',
+                temp_file.name
+            ], check=True)
+        except subprocess.CalledProcessError as e:
+            os.unlink(temp_file.name)
+            raise RuntimeError(f"FFmpeg chunk extraction failed: {str(e)}")
+        return Path(temp_file.name)
+
+    def _chunk_cache_path(self, samples: np.ndarray) -> Path:
+        """Cache file for a chunk, keyed by its 16-bit samples and the backend settings that shape the result"""
+        digest = hashlib.sha256(samples.tobytes())
+        digest.update(self.backend_id.encode())
+        return self.session_folder / CHUNK_CACHE_DIR / f"{digest.hexdigest()}.json"
+
+    def _result_cache_path(self) -> Path:
+        """Cache file for the merged transcript, keyed by the source audio, backend and chunking settings"""
+        key = f"{_cheap_fingerprint(self.audio_path)}|{self.backend_id}|{self.chunk_length}|{self.overlap}"
+        return self.session_folder / RESULT_CACHE_DIR / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    @staticmethod
+    def _store_cached_result(cache_path: Path, result: dict):
+        """Write a chunk or merged result to its cache, atomically so an interrupted run never leaves a partial entry"""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_atomic(cache_path, orjson.dumps(result))
+
+    def _emit_segments(self, segments: list, offset_sec: float):
+        """Forward freshly transcribed segments, shifted to the recording timeline, to on_segments"""
+        if self.on_segments and segments:
+            self.on_segments([
+                {"start": seg["start"] + offset_sec, "end": seg["end"] + offset_sec, "text": seg["text"]}
+                for seg in segments
+            ])
+
+    def _call_local_whisper(self, audio: np.ndarray, offset_sec: float = 0.0) -> dict:
         """Handle local FasterWhisper transcription"""
+        # Silero VAD drops silent regions before the encoder runs; the returned
+        # segment timestamps are mapped back onto the original timeline.
         segments, info = self.whisper_model.transcribe(
-            str(audio_file),
+            audio,
             language="en",
             beam_size=5,
-            vad_filter=False
+            vad_filter=self.vad_filter,
+            vad_parameters=dict(threshold=0.5, min_silence_duration_ms=500)
         )
         
-        # Convert generator to list to allow multiple iterations
-        segments = list(segments)
-        
-        return {
-            "text": " ".join(segment.text for segment in segments),
-            "segments": [{
+        # Consume the generator segment by segment so batches can be forwarded while decoding continues
+        result_segments = []
+        pending = []
+        for idx, segment in enumerate(segments):
+            seg = {
                 "id": idx,
                 "seek": 0,
                 "start": segment.start,
@@ -134,23 +391,52 @@ class AudioTranscriber:
                 "avg_logprob": -0.1,
                 "compression_ratio": 1.0,
                 "no_speech_prob": 0.0
-            } for idx, segment in enumerate(segments)]
+            }
+            result_segments.append(seg)
+            pending.append(seg)
+            if len(pending) >= SEGMENT_BATCH_SIZE:
+                self._emit_segments(pending, offset_sec)
+                pending = []
+        self._emit_segments(pending, offset_sec)
+        
+        return {
+            "text": " ".join(seg["text"] for seg in result_segments),
+            "segments": result_segments
         }
 
-    def transcribe_single_chunk(self, chunk: AudioSegment, chunk_num: int, total_chunks: int) -> tuple[dict, float]:
-        """Transcribe a single audio chunk using either local or Groq"""
+    def transcribe_single_chunk(self, chunk, chunk_num: int, total_chunks: int,
+                                offset_ms: int = 0) -> tuple[dict, float]:
+        """
+        Transcribe a single audio chunk using either local or Groq.
+        For local transcription the chunk is an array of 16-bit samples; for Groq it is
+        the path of a FLAC chunk file, which is removed once the chunk is processed.
+        Near-silent chunks are skipped and yield an empty result. Results are cached per
+        chunk in the session folder, so a rerun after a crash only transcribes what is missing.
+        """
         total_api_time = 0
-        temp_file = tempfile.NamedTemporaryFile(suffix=".flac", delete=False, dir=str(self.session_folder))
-        temp_file.close()
         
         try:
-            chunk.export(temp_file.name, format='flac')
             start_time = time.time()
+            # Groq chunks are decoded for the energy check and cache key; that is far cheaper than an upload.
+            samples = chunk if self.use_local else self._load_pcm16(chunk)
+            cache_path = self._chunk_cache_path(samples)
+            if cache_path.exists():
+                result = orjson.loads(cache_path.read_bytes())
+                print(f"Chunk {chunk_num}/{total_chunks} loaded from cache")
+                self._emit_segments(result["segments"], offset_ms / 1000.0)
+                return result, 0.0
             
-            if self.use_local:
-                result = self._call_local_whisper(Path(temp_file.name))
+            if self._is_silent(samples):
+                print(f"Chunk {chunk_num}/{total_chunks} is silent - skipping transcription")
+                result = {"text": "", "segments": []}
+            elif self.use_local:
+                # Hand the decoded samples straight to faster-whisper instead of
+                # re-encoding to FLAC and decoding them again.
+                result = self._call_local_whisper(self._chunk_to_array(chunk), offset_ms / 1000.0)
             else:
-                result = self._call_groq_api(Path(temp_file.name))
+                result = self._call_groq_api(chunk)
+                self._emit_segments(result["segments"], offset_ms / 1000.0)
+            self._store_cached_result(cache_path, result)
             
             api_time = time.time() - start_time
             total_api_time += api_time
@@ -161,7 +447,35 @@ class AudioTranscriber:
             print(f"Error transcribing chunk {chunk_num}: {str(e)}")
             raise
         finally:
-            os.unlink(temp_file.name)
+            if isinstance(chunk, Path):
+                chunk.unlink(missing_ok=True)
+
+    @staticmethod
+    def _longest_exact_overlap(left: list, right: list) -> int:
+        """
+        Return the length of the longest suffix of left that equals a prefix of right (0 if none),
+        using rolling polynomial hashes so the search is linear in the sequence lengths.
+        """
+        n = min(len(left), len(right))
+        token_ids = {}
+        mod = (1 << 61) - 1
+        base = 1_000_003
+        suffix_hash = prefix_hash = 0
+        power = 1
+        candidates = []
+        for k in range(1, n + 1):
+            left_id = token_ids.setdefault(left[-k], len(token_ids) + 1)
+            right_id = token_ids.setdefault(right[k - 1], len(token_ids) + 1)
+            suffix_hash = (left_id * power + suffix_hash) % mod
+            prefix_hash = (prefix_hash * base + right_id) % mod
+            power = power * base % mod
+            if suffix_hash == prefix_hash:
+                candidates.append(k)
+        # Confirm the longest candidates first to rule out hash collisions.
+        for k in reversed(candidates):
+            if left[-k:] == right[:k]:
+                return k
+        return 0
 
     @staticmethod
     def find_longest_common_sequence(sequences: list[str], match_by_words: bool = True) -> str:
@@ -173,36 +487,58 @@ class AudioTranscriber:
 
         if match_by_words:
             sequences = [
-                [word for word in re.split(r'(\s+\w+)', seq) if word]
+                [word for word in _WORD_SPLIT.split(seq) if word]
                 for seq in sequences
             ]
         else:
             sequences = [list(seq) for seq in sequences]
 
+        # Intern tokens as integer ids so the alignment scan compares whole windows in NumPy.
+        token_ids = {}
+        id_sequences = [
+            np.fromiter((token_ids.setdefault(tok, len(token_ids)) for tok in seq), dtype=np.int32, count=len(seq))
+            for seq in sequences
+        ]
+
         left_sequence = sequences[0]
+        left_ids = id_sequences[0]
         left_length = len(left_sequence)
         total_sequence = []
 
-        for right_sequence in sequences[1:]:
+        for right_sequence, right_ids in zip(sequences[1:], id_sequences[1:]):
             max_matching = 0.0
             right_length = len(right_sequence)
             max_indices = (left_length, left_length, 0, 0)
 
-            for i in range(1, left_length + right_length + 1):
+            # Fast path: an exact suffix/prefix overlap of k tokens scores 1 + k/10000 in the scan
+            # below. Every other alignment is bounded by the larger of these two scores, so when
+            # the bound is lower the exact overlap is the scan's answer and the scan can be skipped.
+            overlap = AudioTranscriber._longest_exact_overlap(left_sequence, right_sequence)
+            shortest = min(left_length, right_length)
+            total = left_length + right_length
+            best_other = max(shortest / (shortest + 1) + (shortest + 1) / 10000.0,
+                             shortest / total + total / 10000.0) if total else 0.0
+            if overlap > 1 and best_other < 1.0 + overlap / 10000.0:
+                max_indices = (left_length - overlap, left_length, 0, overlap)
+                scan_range = ()
+            else:
+                scan_range = range(1, left_length + right_length + 1)
+
+            for i in scan_range:
                 eps = float(i) / 10000.0
 
                 left_start = max(0, left_length - i)
                 left_stop = min(left_length, left_length + right_length - i)
-                left = left_sequence[left_start:left_stop]
 
                 right_start = max(0, i - left_length)
                 right_stop = min(right_length, i)
-                right = right_sequence[right_start:right_stop]
 
-                if len(left) != len(right):
+                if left_stop - left_start != right_stop - right_start:
                     raise RuntimeError("Mismatched subsequences detected during transcript merging.")
 
-                matches = sum(a == b for a, b in zip(left, right))
+                matches = int(np.count_nonzero(
+                    left_ids[left_start:left_stop] == right_ids[right_start:right_stop]
+                ))
                 matching = matches / float(i) + eps
                 if matches > 1 and matching > max_matching:
                     max_matching = matching
@@ -214,6 +550,7 @@ class AudioTranscriber:
 
             total_sequence.extend(left_sequence[:left_mid])
             left_sequence = right_sequence[right_mid:]
+            left_ids = right_ids[right_mid:]
             left_length = len(left_sequence)
 
         total_sequence.extend(left_sequence)
@@ -231,28 +568,22 @@ class AudioTranscriber:
         # Process each chunk and update segment times to global times.
         for i, (chunk, offset_ms) in enumerate(results):
             offset_sec = offset_ms / 1000.0
-            # Remove model_dump() check and handle raw dict
-            data = chunk if isinstance(chunk, dict) else chunk.model_dump()
-            #print(data) # for debugging
+            segments = chunk['segments']
             
             # Update each segment's times by adding the chunk's starting offset.
-            for seg in data['segments']:
+            for seg in segments:
                 seg['start'] += offset_sec
                 seg['end'] += offset_sec
             
-            segments = data['segments']
-            
             if i < len(results) - 1:
                 # Convert the next chunk's start to seconds.
                 next_start_sec = results[i + 1][1] / 1000.0
-                current_segments = []
-                overlap_segments = []
-                
-                for segment in segments:
-                    if segment['end'] > next_start_sec:
-                        overlap_segments.append(segment)
-                    else:
-                        current_segments.append(segment)
+                # Segments are time-ordered, so one binary search on the end times splits
+                # them into those finishing before the next chunk starts and the overlap.
+                ends = [segment['end'] for segment in segments]
+                split = bisect.bisect_right(ends, next_start_sec)
+                current_segments = segments[:split]
+                overlap_segments = segments[split:]
                 
                 if overlap_segments:
                     merged_overlap = overlap_segments[0].copy()
@@ -267,6 +598,10 @@ class AudioTranscriber:
                 processed_chunks.append(segments)
         
         for i in range(len(processed_chunks) - 1):
+            # Silent chunks have no segments, so there is no boundary to stitch.
+            if not processed_chunks[i] or not processed_chunks[i + 1]:
+                final_segments.extend(processed_chunks[i])
+                continue
             final_segments.extend(processed_chunks[i][:-1])
             last_segment = processed_chunks[i][-1]
             first_segment = processed_chunks[i + 1][0]
@@ -298,19 +633,15 @@ class AudioTranscriber:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             base_path = output_dir / f"{self.audio_path.stem}_{timestamp}"
             
-            with open(f"{base_path}.txt", 'w', encoding='utf-8') as f:
-                f.write(result["text"])
+            _write_atomic(f"{base_path}.txt", result["text"])
                 
-            with open(f"{base_path}_full.json", 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            
-            with open(f"{base_path}_segments.json", 'w', encoding='utf-8') as f:
-                json.dump(result["segments"], f, indent=2, ensure_ascii=False)
+            # Segments live under "segments" in the full JSON; they are not written a second time.
+            _write_atomic(f"{base_path}_full.json",
+                          orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
             
             print(f"\nResults saved to session folder:")
             print(f"- {base_path}.txt")
             print(f"- {base_path}_full.json")
-            print(f"- {base_path}_segments.json")
             return base_path
         except IOError as e:
             print(f"Error saving results: {str(e)}")
@@ -321,49 +652,91 @@ class AudioTranscriber:
         Main method to transcribe the audio file into text by processing chunks.
         """
         print(f"\nStarting transcription of: {self.audio_path}")
-        processed_audio = None
-        try:
-            processed_audio = self.preprocess_audio()
+        if not self.audio_path.exists():
+            raise FileNotFoundError(f"Input file not found: {self.audio_path}")
+        # An unchanged recording transcribed with the same settings is answered from disk.
+        result_cache_path = self._result_cache_path()
+        if self.use_cache and result_cache_path.exists():
+            final_result = orjson.loads(result_cache_path.read_bytes())
+            print(f"Using cached transcription: {result_cache_path}")
+            self._emit_segments(final_result["segments"], 0.0)
+            return final_result
+
+        # The preprocessed FLAC is either the source itself or a cache entry in the session folder, so it is kept afterwards.
+        processed_audio = self.preprocess_audio()
+        if self.use_local:
+            # Decode once; each local chunk is then a zero-copy slice of this array.
             try:
-                audio = AudioSegment.from_file(processed_audio, format="flac")
-            except Exception as e:
+                samples = self._load_pcm16(processed_audio)
+            except subprocess.CalledProcessError as e:
                 raise RuntimeError(f"Failed to load audio: {str(e)}")
-            
-            duration = len(audio)
-            print(f"Audio duration: {duration/1000:.2f}s")
-            
-            chunk_ms = self.chunk_length * 1000
-            overlap_ms = self.overlap * 1000
-            total_chunks = (duration // (chunk_ms - overlap_ms)) + 1
-            print(f"Processing {total_chunks} chunks...")
-            
-            results = []
-            total_transcription_time = 0
-            
-            for i in range(total_chunks):
-                start = i * (chunk_ms - overlap_ms)
-                end = min(start + chunk_ms, duration)
-                print(f"\nProcessing chunk {i+1}/{total_chunks}")
-                print(f"Time range: {start/1000:.1f}s - {end/1000:.1f}s")
-                
-                chunk = audio[start:end]
-                result, chunk_time = self.transcribe_single_chunk(chunk, i+1, total_chunks)
-                total_transcription_time += chunk_time
-                results.append((result, start))
-            
-            final_result = self.merge_transcripts(results)
-            self.save_results(final_result, self.audio_path)
-            print(f"\nTotal Groq API transcription time: {total_transcription_time:.2f}s")
-            return final_result
-        finally:
-            if processed_audio:
-                Path(processed_audio).unlink(missing_ok=True)
+            duration = len(samples) * 1000 // SAMPLE_RATE
+        else:
+            # Groq chunks are cut straight from the FLAC, so only the duration is needed.
+            duration = self._probe_duration_ms(processed_audio)
+        print(f"Audio duration: {duration/1000:.2f}s")
+        
+        chunk_ms = self.chunk_length * 1000
+        overlap_ms = self.overlap * 1000
+        total_chunks = (duration // (chunk_ms - overlap_ms)) + 1
+        print(f"Processing {total_chunks} chunks...")
+        
+        # Compute every chunk's time range up front so they can be dispatched together.
+        ranges = []
+        for i in range(total_chunks):
+            start = i * (chunk_ms - overlap_ms)
+            end = min(start + chunk_ms, duration)
+            print(f"Chunk {i+1}/{total_chunks} time range: {start/1000:.1f}s - {end/1000:.1f}s")
+            ranges.append((start, end))
+
+        def run_chunk(i, start, end):
+            if self.use_local:
+                chunk = samples[start * SAMPLE_RATE // 1000:end * SAMPLE_RATE // 1000]
+            else:
+                chunk = self._cut_chunk(processed_audio, start, end)
+            return self.transcribe_single_chunk(chunk, i+1, total_chunks, offset_ms=start)
+        
+        results = [None] * total_chunks
+        total_transcription_time = 0
+        
+        # Groq requests are network-bound and run concurrently; the local model runs one chunk at a time.
+        max_workers = 1 if self.use_local else max(1, self.max_concurrency)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(run_chunk, i, start, end): (i, start)
+                for i, (start, end) in enumerate(ranges)
+            }
+            try:
+                for future in as_completed(futures):
+                    i, start = futures[future]
+                    result, chunk_time = future.result()
+                    total_transcription_time += chunk_time
+                    results[i] = (result, start)
+            except BaseException:
+                # Drop chunks that have not started yet so a failure is reported without
+                # first cutting and uploading the rest of the recording.
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+        
+        final_result = self.merge_transcripts(results)
+        self.save_results(final_result, self.audio_path)
+        self._store_cached_result(result_cache_path, final_result)
+        print(f"\nTotal Groq API transcription time: {total_transcription_time:.2f}s")
+        return final_result
+
+    async def transcribe_async(self) -> dict:
+        """
+        Awaitable transcribe() for callers running an event loop. The work runs in a worker
+        thread, so several transcribers can be awaited together with asyncio.gather.
+        """
+        return await asyncio.to_thread(self.transcribe)
 
     def merge_device_and_mic_transcripts(self, device_transcript: dict, mic_transcript: dict) -> dict:
         """
-        Merge the device and mic transcripts by simply appending the mic transcript after the device transcript,
-        while preserving the timestamps for each segment. The final transcript text shows each segment with its
-        formatted start and end times.
+        Merge the device and mic transcripts into a single conversation ordered by segment start time,
+        while preserving the timestamps for each segment. Each source is already time-ordered, so the two
+        streams are interleaved with a linear heapq.merge. The final transcript text shows each segment with
+        its formatted start and end times.
 
         Args:
             device_transcript (dict): Transcript dictionary from the device (must include a "segments" key).
@@ -372,7 +745,7 @@ class AudioTranscriber:
         Returns:
             dict: A merged transcript containing:
                   - "text": The final transcript text with timestamps.
-                  - "segments": A simple concatenation of the device and mic transcript segments.
+                  - "segments": The device and mic transcript segments interleaved by start time.
         """
         
         # Tag segments with their source identifier.
@@ -383,27 +756,16 @@ class AudioTranscriber:
         for seg in mic_segments:
             seg["source"] = "mic"
 
-        # Simple merging: just append the mic segments to the device segments.
-        merged_segments = device_segments + mic_segments
+        # Both inputs are sorted by start time, so a single linear merge keeps the conversation order.
+        merged_segments = list(heapq.merge(device_segments, mic_segments, key=lambda seg: seg["start"]))
 
-        # Helper function to format timestamps (in seconds).
-        def format_timestamp(seconds):
-            m, s = divmod(seconds, 60)
-            h, m = divmod(m, 60)
-            if h:
-                return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
-            else:
-                return f"{int(m):02d}:{int(s):02d}"
-
-        # Build the final transcript text from each segment.
-        final_lines = []
-        for seg in merged_segments:
-            start_formatted = format_timestamp(seg["start"])
-            end_formatted = format_timestamp(seg["end"])
-            speaker = "Device" if seg["source"] == "device" else "Mic"
-            final_lines.append(f"[{start_formatted} - {end_formatted}] {speaker}: {seg['text'].strip()}")
-        
-        merged_text = "\n".join(final_lines)
+        # Build the final transcript text from each segment in a single join.
+        fmt = format_timestamp
+        speakers = {"device": "Device", "mic": "Mic"}
+        merged_text = "\n".join(
+            f"[{fmt(seg['start'])} - {fmt(seg['end'])}] {speakers[seg['source']]}: {seg['text'].strip()}"
+            for seg in merged_segments
+        )
 
         return {
             "text": merged_text,
@@ -0,0 +1,113 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The recorder module needs its capture and noise reduction libraries to import at all.
+pytest.importorskip("pyaudiowpatch")
+pytest.importorskip("noisereduce")
+
+from mikey.audio_recorder import (  # noqa: E402
+    AudioRecorder, _RingBuffer, NR_BLOCK_SECONDS, NR_OVERLAP_SECONDS, NR_SILENCE_RMS,
+)
+
+RATE = 1000
+
+
+def denoise(recorder, audio_data):
+    return np.concatenate(list(recorder._iter_denoised_blocks(audio_data, RATE)), axis=1)
+
+
+@pytest.mark.parametrize("channels, seconds", [(1, 35.5), (2, 21), (1, 10.5), (2, 3)])
+def test_blocks_reassemble_the_input_with_an_identity_reducer(channels, seconds):
+    recorder = AudioRecorder()
+    calls = []
+
+    def identity(block, noise_clip, rate):
+        calls.append(block.shape[1])
+        assert noise_clip.shape == (channels, RATE)
+        return block.copy()
+
+    recorder._reduce_noise = identity
+    rng = np.random.default_rng(0)
+    audio_data = rng.uniform(-0.5, 0.5, (channels, int(seconds * RATE))).astype(np.float32)
+    original = audio_data.copy()
+
+    output = denoise(recorder, audio_data)
+
+    np.testing.assert_allclose(output, original, atol=1e-6)
+    np.testing.assert_array_equal(audio_data, original)
+    step = NR_BLOCK_SECONDS * RATE
+    overlap = NR_OVERLAP_SECONDS * RATE
+    # The last block runs to the end, so a remainder no longer than the overlap joins it.
+    assert len(calls) == max(1, -(-(audio_data.shape[1] - overlap) // step))
+    assert all(length <= step + overlap for length in calls)
+
+
+def test_overlap_is_crossfaded_linearly_into_the_next_block():
+    recorder = AudioRecorder()
+    levels = iter([0.0, 1.0])
+    recorder._reduce_noise = lambda block, noise_clip, rate: np.full_like(block, next(levels))
+    audio_data = np.full((1, 15 * RATE), 0.5, dtype=np.float32)
+
+    output = denoise(recorder, audio_data)[0]
+
+    step = NR_BLOCK_SECONDS * RATE
+    overlap = NR_OVERLAP_SECONDS * RATE
+    assert output.shape == (15 * RATE,)
+    np.testing.assert_array_equal(output[:step], 0.0)
+    np.testing.assert_allclose(output[step:step + overlap], np.linspace(0.0, 1.0, overlap), atol=1e-6)
+    np.testing.assert_array_equal(output[step + overlap:], 1.0)
+
+
+def test_near_silent_blocks_skip_noise_reduction():
+    recorder = AudioRecorder()
+    reduced = []
+    recorder._reduce_noise = lambda block, noise_clip, rate: reduced.append(block.shape) or block * 0
+    floor = np.float32(NR_SILENCE_RMS / 2)
+    audio_data = np.full((1, 25 * RATE), floor, dtype=np.float32)
+    audio_data[:, 12 * RATE:13 * RATE] = 0.5
+
+    output = denoise(recorder, audio_data)[0]
+
+    # Only the middle block (10 s - 21 s) is loud enough to be reduced.
+    assert len(reduced) == 1
+    np.testing.assert_array_equal(output[:10 * RATE], floor)
+    np.testing.assert_array_equal(output[21 * RATE:], floor)
+
+
+def test_ring_capacity_rounds_up_to_a_power_of_two():
+    assert _RingBuffer(1000).capacity == 1024
+    assert _RingBuffer(1024).capacity == 1024
+
+
+def test_ring_round_trip_across_the_wrap():
+    ring = _RingBuffer(16)
+    out = bytearray()
+    assert ring.write(bytes(range(10)))
+    assert ring.drain_into(out) == 10
+    # Starts at offset 10 of 16, so this write wraps around the end of the storage.
+    assert ring.write(bytes(range(10, 22)))
+    assert ring.drain_into(out) == 12
+    assert out == bytes(range(22))
+    assert ring.drain_into(out) == 0
+    assert ring.dropped == 0
+
+
+def test_ring_drops_and_counts_writes_that_do_not_fit():
+    ring = _RingBuffer(16)
+    out = bytearray()
+    assert ring.write(b"a" * 12)
+    assert not ring.write(b"b" * 5)
+    assert ring.dropped == 5
+    assert ring.write(b"c" * 4)
+    ring.drain_into(out)
+    assert out == b"a" * 12 + b"c" * 4
+    # Draining frees the space again.
+    assert ring.write(b"d" * 16)
+    ring.drain_into(out)
+    assert out[-16:] == b"d" * 16
+    assert ring.dropped == 5
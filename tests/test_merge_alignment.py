@@ -0,0 +1,93 @@
+import random
+import re
+import sys
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The module puts the bundled FFmpeg on PATH at import time; the merge logic never runs it.
+with mock.patch("core.utils.get_ffmpeg_path", return_value=sys.executable):
+    from mikey.audio_transcriber import AudioTranscriber
+
+
+def reference_merge(sequences, match_by_words=True):
+    """Plain full alignment scan that find_longest_common_sequence must agree with."""
+    if not sequences:
+        return ""
+    if match_by_words:
+        sequences = [[word for word in re.split(r'(\s+\w+)', seq) if word] for seq in sequences]
+    else:
+        sequences = [list(seq) for seq in sequences]
+
+    left_sequence = sequences[0]
+    total_sequence = []
+    for right_sequence in sequences[1:]:
+        left_length = len(left_sequence)
+        right_length = len(right_sequence)
+        max_matching = 0.0
+        max_indices = (left_length, left_length, 0, 0)
+        for i in range(1, left_length + right_length + 1):
+            left_start = max(0, left_length - i)
+            left_stop = min(left_length, left_length + right_length - i)
+            right_start = max(0, i - left_length)
+            right_stop = min(right_length, i)
+            matches = sum(a == b for a, b in zip(left_sequence[left_start:left_stop],
+                                                 right_sequence[right_start:right_stop]))
+            matching = matches / float(i) + i / 10000.0
+            if matches > 1 and matching > max_matching:
+                max_matching = matching
+                max_indices = (left_start, left_stop, right_start, right_stop)
+        left_start, left_stop, right_start, right_stop = max_indices
+        total_sequence.extend(left_sequence[:(left_stop + left_start) // 2])
+        left_sequence = right_sequence[(right_stop + right_start) // 2:]
+    total_sequence.extend(left_sequence)
+    return ''.join(total_sequence)
+
+
+def random_text(rng, vocabulary, length):
+    return ''.join(' ' + rng.choice(vocabulary) for _ in range(length))
+
+
+def test_matches_reference_on_random_text():
+    rng = random.Random(0)
+    for _ in range(1500):
+        vocabulary = [f"w{n}" for n in range(rng.randint(1, 6))]
+        sequences = [random_text(rng, vocabulary, rng.randint(0, 25)) for _ in range(rng.randint(1, 4))]
+        for match_by_words in (True, False):
+            assert (AudioTranscriber.find_longest_common_sequence(sequences, match_by_words)
+                    == reference_merge(sequences, match_by_words)), (sequences, match_by_words)
+
+
+def test_matches_reference_on_exact_overlaps():
+    rng = random.Random(1)
+    for _ in range(1500):
+        vocabulary = [f"w{n}" for n in range(rng.randint(1, 30))]
+        shared = random_text(rng, vocabulary, rng.randint(0, 20))
+        left = random_text(rng, vocabulary, rng.randint(0, 40)) + shared
+        right = shared + random_text(rng, vocabulary, rng.randint(0, 40))
+        sequences = [left, right]
+        for match_by_words in (True, False):
+            assert (AudioTranscriber.find_longest_common_sequence(sequences, match_by_words)
+                    == reference_merge(sequences, match_by_words)), (sequences, match_by_words)
+
+
+def test_matches_reference_when_long_near_overlap_beats_short_exact_overlap():
+    # A few hundred aligned tokens with a handful of mismatches outscore a two-token exact
+    # suffix/prefix overlap, so the fast path must fall back to the full scan here.
+    rng = random.Random(2)
+    vocabulary = [f"w{n}" for n in range(1000)]
+    for _ in range(40):
+        shared = [' ' + rng.choice(vocabulary) for _ in range(rng.randint(100, 400))]
+        corrupted = list(shared)
+        for index in rng.sample(range(len(corrupted)), rng.randint(1, 3)):
+            corrupted[index] = ' changed'
+        edge = ' q r'
+        left = random_text(rng, vocabulary, rng.randint(2, 30)) + ''.join(shared) + edge
+        right = edge + ''.join(corrupted) + random_text(rng, vocabulary, rng.randint(2, 30))
+        assert (AudioTranscriber.find_longest_common_sequence([left, right])
+                == reference_merge([left, right])), (left, right)
+
+
+def test_empty_input():
+    assert AudioTranscriber.find_longest_common_sequence([]) == ""
@@ -0,0 +1,66 @@
+import sys
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# The module puts the bundled FFmpeg on PATH at import time; the silence gate never runs it.
+with mock.patch("core.utils.get_ffmpeg_path", return_value=sys.executable):
+    from mikey.audio_transcriber import (
+        AudioTranscriber, SAMPLE_RATE, SILENCE_FRAME_MS, SILENCE_RMS_THRESHOLD,
+    )
+
+FRAME = SAMPLE_RATE * SILENCE_FRAME_MS // 1000
+
+
+def quiet(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, SILENCE_RMS_THRESHOLD / 10, int(seconds * SAMPLE_RATE)).astype(np.int16)
+
+
+def test_empty_and_zero_chunks_are_silent():
+    assert AudioTranscriber._is_silent(np.zeros(0, dtype=np.int16))
+    assert AudioTranscriber._is_silent(np.zeros(10 * SAMPLE_RATE, dtype=np.int16))
+
+
+def test_quiet_chunk_is_silent():
+    assert AudioTranscriber._is_silent(quiet(60))
+
+
+def test_short_speech_in_long_quiet_chunk_is_not_silent():
+    samples = quiet(600)
+    rng = np.random.default_rng(1)
+    start = 300 * SAMPLE_RATE
+    samples[start:start + 3 * SAMPLE_RATE] = rng.normal(0, 500, 3 * SAMPLE_RATE).astype(np.int16)
+    assert not AudioTranscriber._is_silent(samples)
+
+
+def test_threshold_is_inclusive_on_a_single_frame():
+    samples = np.zeros(100 * FRAME, dtype=np.int16)
+    samples[40 * FRAME:41 * FRAME] = SILENCE_RMS_THRESHOLD
+    assert not AudioTranscriber._is_silent(samples)
+    samples[40 * FRAME:41 * FRAME] = SILENCE_RMS_THRESHOLD - 1
+    assert AudioTranscriber._is_silent(samples)
+
+
+def test_loud_frame_across_a_scan_block_boundary():
+    # _is_silent scans 2048 frames at a time; a loud frame on either side of that seam counts.
+    boundary = 2048 * FRAME
+    samples = np.zeros(boundary * 2, dtype=np.int16)
+    samples[boundary - FRAME:boundary] = 1000
+    assert not AudioTranscriber._is_silent(samples)
+    samples[:] = 0
+    samples[boundary:boundary + FRAME] = 1000
+    assert not AudioTranscriber._is_silent(samples)
+
+
+def test_trailing_partial_frame_is_judged_on_its_own_length():
+    samples = np.zeros(10 * FRAME + FRAME // 4, dtype=np.int16)
+    samples[10 * FRAME:] = 1000
+    assert not AudioTranscriber._is_silent(samples)
+    samples[10 * FRAME:] = SILENCE_RMS_THRESHOLD - 1
+    assert AudioTranscriber._is_silent(samples)
+    # Shorter than one frame in total.
+    assert not AudioTranscriber._is_silent(np.full(FRAME // 2, 1000, dtype=np.int16))